@@ -187,6 +187,11 @@ Examples:
         action='store_true',
         help='Enable verbose logging'
     )
+    exec_group.add_argument(
+        '--force-cache-refresh',
+        action='store_true',
+        help='Refresh the package manager cache even if it was updated recently'
+    )
 
     args = parser.parse_args()
 
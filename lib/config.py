@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import quote_plus
 
-from .os_detect import OSInfo
+from .os_detect import OSInfo, get_package_manager
 from .utils import generate_random_password, detect_host_ip, validate_ip_address
 
 
@@ -51,6 +51,7 @@ class InstallerContext:
 
     # Optional fields with defaults
     data_dir: Optional[str] = None  # If None, uses install_dir
+    force_cache_refresh: bool = False  # Refresh package cache even when fresh
 
     def __post_init__(self):
         """Initialize computed properties after dataclass init."""
@@ -58,6 +59,11 @@ class InstallerContext:
         if self.data_dir is None:
             self.data_dir = self.install_dir
 
+    @property
+    def package_manager(self) -> str:
+        """Package manager command for the detected OS ('apt' or 'dnf')."""
+        return get_package_manager(self.os_info.os_type)
+
     @property
     def database_url(self) -> str:
         """
@@ -265,6 +271,7 @@ def create_context_from_args(args: Namespace, os_info: OSInfo) -> InstallerConte
         skip_windows_isos=args.skip_windows_isos,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        force_cache_refresh=args.force_cache_refresh,
     )
 
     # Validate configuration
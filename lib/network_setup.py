@@ -118,20 +118,17 @@ def create_default_libvirt_network(context: InstallerContext) -> bool:
         with open(xml_path, 'w') as f:
             f.write(network_xml)
 
-        # Define the network
-        log_debug("Defining network from XML...")
-        result = run_command(f'virsh net-define {xml_path}', check=False, capture_output=True)
+        # Define and start the network in one virsh batch invocation.
+        # virsh runs semicolon-separated commands over a single libvirtd
+        # connection, so this pays one process spawn and one connect
+        # handshake instead of two of each.
+        log_debug("Defining and starting network from XML...")
+        result = run_command(
+            ['virsh', f'net-define {xml_path} ; net-start infinibay'],
+            check=False, capture_output=True
+        )
         if not result or result.returncode != 0:
-            log_error("Failed to define network")
-            if result and result.stderr:
-                log_error(f"Error: {result.stderr}")
-            return False
-
-        # Start the network
-        log_debug("Starting network...")
-        result = run_command('virsh net-start infinibay', check=False, capture_output=True)
-        if not result or result.returncode != 0:
-            log_error("Failed to start network")
+            log_error("Failed to define/start network")
             if result and result.stderr:
                 log_error(f"Error: {result.stderr}")
             return False
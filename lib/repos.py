@@ -7,6 +7,7 @@ This module handles:
 - Verifying successful builds
 """
 
+import functools
 import os
 import subprocess
 import time
@@ -305,10 +306,15 @@ def build_infinization(context: InstallerContext):
         raise
 
 
+@functools.lru_cache(maxsize=None)
 def get_directory_owner(directory: str) -> tuple:
     """
     Get the owner (uid, gid) of a directory.
 
+    Memoized per path: the build and service phases re-derive the owner
+    of the same install directories several times during one run, and the
+    answer cannot change while the installer itself holds them.
+
     Args:
         directory: Path to directory
 
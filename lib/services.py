@@ -9,15 +9,172 @@ This module handles:
 """
 
 import os
+import re
 import shutil
+import string
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .config import InstallerContext
 from .logger import log_step, log_info, log_success, log_warning, log_error, log_debug, log_section
 from .utils import run_command, generate_random_password
 from .repos import get_directory_owner, restore_ownership
 
+# Env-file layouts parsed once at import time; the generators only
+# substitute the per-install values.
+BACKEND_ENV_TEMPLATE = string.Template("""# Database
+DATABASE_URL="${database_url}"
+
+# CORS
+FRONTEND_URL="*"
+
+# JWT
+TOKENKEY="${tokenkey}"
+
+# Server
+PORT=${backend_port}
+
+# Security
+BCRYPT_ROUNDS=10
+
+# Default Admin User
+DEFAULT_ADMIN_EMAIL="${admin_email}"
+DEFAULT_ADMIN_PASSWORD="${admin_password}"
+
+# InfiniService RPC
+RPC_URL="http://localhost:9090"
+
+# VirtIO Windows Drivers ISO (OPTIONAL - auto-detected if not set)
+# The system will automatically search common locations:
+#   - /usr/share/virtio-win/*.iso (Fedora/RHEL package)
+#   - ${iso_permanent_dir}/virtio-win*.iso (Infinibay managed)
+# Only set this if you want to override auto-detection or use a custom location
+# VIRTIO_WIN_ISO_PATH=/path/to/virtio-win.iso
+
+# Application Configuration
+APP_HOST=${host_ip}
+INFINIBAY_BASE_DIR=${data_dir}
+INFINIBAY_ISO_DIR=${iso_dir}
+INFINIBAY_ISO_TEMP_DIR=${iso_temp_dir}
+INFINIBAY_ISO_PERMANENT_DIR=${iso_permanent_dir}
+INFINIBAY_WALLPAPERS_DIR=${wallpapers_dir}
+
+# Graphics
+GRAPHIC_HOST=${host_ip}
+
+# Infinization Configuration (configured programmatically, not via env vars)
+# Default directories: /var/lib/infinization/disks, /var/lib/infinization/sockets, /var/lib/infinization/pids
+""")
+
+FRONTEND_ENV_TEMPLATE = string.Template("""# Backend API URLs
+NEXT_PUBLIC_BACKEND_HOST=${backend_url}
+NEXT_PUBLIC_GRAPHQL_API_URL=${graphql_url}
+""")
+
+# Systemd unit file layout shared by both services. Built once at import
+# time; create_systemd_service only substitutes the per-service values.
+SYSTEMD_SERVICE_TEMPLATE = string.Template("""[Unit]
+Description=${description}
+After=network.target postgresql.service
+Requires=postgresql.service
+
+[Service]
+Type=simple
+User=root
+WorkingDirectory=${working_dir}
+ExecStart=${exec_start}
+Restart=always
+RestartSec=10
+StandardOutput=journal
+StandardError=journal
+Environment="NODE_ENV=production"
+Environment="PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
+
+[Install]
+WantedBy=multi-user.target
+""")
+
+# The static boilerplate between the three substituted fields is encoded
+# to bytes once at import time; create_systemd_service hands the chunks to
+# os.writev so only the per-service values are encoded per call.
+_SERVICE_TEMPLATE_SPLIT = re.split(r'\$\{(\w+)\}', SYSTEMD_SERVICE_TEMPLATE.template)
+SERVICE_STATIC_CHUNKS = tuple(chunk.encode('utf-8') for chunk in _SERVICE_TEMPLATE_SPLIT[0::2])
+SERVICE_FIELD_ORDER = tuple(_SERVICE_TEMPLATE_SPLIT[1::2])
+
+
+def _writev_all(fd: int, buffers: list):
+    """
+    Write all buffers to an fd, finishing any short write.
+
+    The kernel accepts these small payloads in one writev in practice,
+    but POSIX allows a partial write; the remainder is flushed with
+    plain os.write so the destination is never left truncated.
+    """
+    total = sum(len(buf) for buf in buffers)
+    written = os.writev(fd, buffers)
+    if written == total:
+        return
+
+    remaining = b''.join(buffers)[written:]
+    while remaining:
+        count = os.write(fd, remaining)
+        remaining = remaining[count:]
+
+
+def _write_config_file(path: str, content: str, mode: int):
+    """
+    Write a small configuration file and set its permissions.
+
+    All generated files (.env files, systemd units) go through this single
+    code path so the write sequence lives in one place. A batched io_uring
+    submission was considered for these writes, but it would pull a compiled
+    third-party binding into an installer that must run on a bare host
+    before any dependencies are installable, so the plain one-shot write
+    is kept.
+
+    Args:
+        path: Destination file path
+        content: File content - a string, or a sequence of bytes buffers
+            gathered into the file with a single os.writev call
+        mode: Permission bits to set (e.g. 0o600)
+    """
+    if isinstance(content, str):
+        buffers = [content.encode('utf-8')]
+    else:
+        buffers = list(content)
+    directory = os.path.dirname(path) or '.'
+
+    try:
+        # Fast path: write to an unnamed O_TMPFILE in the target directory
+        # and link it into place once complete, so a crash mid-write can
+        # never leave a truncated .env or unit file behind.
+        fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, mode)
+        try:
+            _writev_all(fd, buffers)
+            # os.open applies mode under the umask; fchmod enforces it exactly
+            os.fchmod(fd, mode)
+            # linkat cannot replace an existing name; drop any old file first
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            os.link(f"/proc/self/fd/{fd}", path)
+        finally:
+            os.close(fd)
+        return
+    except OSError:
+        # O_TMPFILE unsupported (pre-3.11 kernel or filesystem); fall back
+        # to a direct one-shot write
+        pass
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        _writev_all(fd, buffers)
+        os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
 
 def generate_backend_env(context: InstallerContext):
     """
@@ -56,58 +213,31 @@ def generate_backend_env(context: InstallerContext):
     # The .env file stores the encoded version since Prisma reads it directly
     database_url = context.database_url
 
-    # Build .env content with all variables from backend/.env.example
-    env_content = f"""# Database
-DATABASE_URL="{database_url}"
-
-# CORS
-FRONTEND_URL="*"
-
-# JWT
-TOKENKEY="{tokenkey}"
-
-# Server
-PORT={context.backend_port}
-
-# Security
-BCRYPT_ROUNDS=10
-
-# Default Admin User
-DEFAULT_ADMIN_EMAIL="{context.admin_email}"
-DEFAULT_ADMIN_PASSWORD="{context.admin_password}"
-
-# InfiniService RPC
-RPC_URL="http://localhost:9090"
-
-# VirtIO Windows Drivers ISO (OPTIONAL - auto-detected if not set)
-# The system will automatically search common locations:
-#   - /usr/share/virtio-win/*.iso (Fedora/RHEL package)
-#   - {context.iso_permanent_dir}/virtio-win*.iso (Infinibay managed)
-# Only set this if you want to override auto-detection or use a custom location
-# VIRTIO_WIN_ISO_PATH=/path/to/virtio-win.iso
-
-# Application Configuration
-APP_HOST={context.host_ip}
-INFINIBAY_BASE_DIR={context.data_dir}
-INFINIBAY_ISO_DIR={context.iso_dir}
-INFINIBAY_ISO_TEMP_DIR={context.iso_temp_dir}
-INFINIBAY_ISO_PERMANENT_DIR={context.iso_permanent_dir}
-INFINIBAY_WALLPAPERS_DIR={context.wallpapers_dir}
-
-# Graphics
-GRAPHIC_HOST={context.host_ip}
-
-# Infinization Configuration (configured programmatically, not via env vars)
-# Default directories: /var/lib/infinization/disks, /var/lib/infinization/sockets, /var/lib/infinization/pids
-"""
+    # Bind values used more than once below to locals; these are computed
+    # properties on the context, so each access rebuilds a string
+    host_ip = context.host_ip
+    iso_permanent_dir = context.iso_permanent_dir
+
+    # Build .env content (variables from backend/.env.example) from the
+    # module-level template
+    env_content = BACKEND_ENV_TEMPLATE.substitute(
+        database_url=database_url,
+        tokenkey=tokenkey,
+        backend_port=context.backend_port,
+        admin_email=context.admin_email,
+        admin_password=context.admin_password,
+        iso_permanent_dir=iso_permanent_dir,
+        host_ip=host_ip,
+        data_dir=context.data_dir,
+        iso_dir=context.iso_dir,
+        iso_temp_dir=context.iso_temp_dir,
+        wallpapers_dir=context.wallpapers_dir,
+    )
 
     try:
         env_path = os.path.join(context.backend_dir, ".env")
-        with open(env_path, 'w') as f:
-            f.write(env_content)
-
-        # Set secure permissions (owner read/write only)
-        os.chmod(env_path, 0o600)
+        # Secure permissions (owner read/write only)
+        _write_config_file(env_path, env_content, 0o600)
 
         log_success(f"Backend .env created at {env_path}")
         log_debug("TOKENKEY generated and saved")
@@ -141,19 +271,17 @@ def generate_frontend_env(context: InstallerContext):
         log_info(f"  NEXT_PUBLIC_GRAPHQL_API_URL={context.graphql_url}")
         return
 
-    # Build .env content with variables from frontend/.env.example
-    env_content = f"""# Backend API URLs
-NEXT_PUBLIC_BACKEND_HOST={context.backend_url}
-NEXT_PUBLIC_GRAPHQL_API_URL={context.graphql_url}
-"""
+    # Build .env content (variables from frontend/.env.example) from the
+    # module-level template
+    env_content = FRONTEND_ENV_TEMPLATE.substitute(
+        backend_url=context.backend_url,
+        graphql_url=context.graphql_url,
+    )
 
     try:
         env_path = os.path.join(context.frontend_dir, ".env")
-        with open(env_path, 'w') as f:
-            f.write(env_content)
-
-        # Set readable permissions
-        os.chmod(env_path, 0o644)
+        # Readable permissions
+        _write_config_file(env_path, env_content, 0o644)
 
         log_success(f"Frontend .env created at {env_path}")
 
@@ -369,18 +497,23 @@ def run_backend_setup(context: InstallerContext):
         log_info("  2. npm run setup")
         return
 
+    # Build the child environment once for both setup steps: a single
+    # os.environ.copy() with DATABASE_URL merged in, preserving PATH
+    env = os.environ.copy()
+    env["DATABASE_URL"] = context.database_url
+
     # Step 1: Run Prisma migrations
     log_info("Step 1/2: Running database migrations...")
     try:
-        # Merge DATABASE_URL into os.environ to preserve PATH
-        env = os.environ.copy()
-        env["DATABASE_URL"] = context.database_url
-
+        # Stream output instead of buffering the whole run; migrations can
+        # log a lot and the tail is retained for failure diagnostics
         result = run_command(
             "npx prisma migrate deploy",
             cwd=context.backend_dir,
             timeout=600,  # 10 minutes
-            env=env
+            env=env,
+            check=False,
+            stream=True
         )
         if not result.success:
             log_error("Database migration failed")
@@ -388,8 +521,8 @@ def run_backend_setup(context: InstallerContext):
             log_error(f"  - PostgreSQL is running: systemctl status postgresql")
             log_error(f"  - Database is accessible: psql -h {context.db_host} -U {context.db_user} -d {context.db_name}")
             log_error(f"  - DATABASE_URL is correct: {context.database_url}")
-            if result.stderr:
-                log_error(f"Error output: {result.stderr}")
+            if result.stdout:
+                log_error(f"Last output:\n{result.stdout}")
             raise RuntimeError("Prisma migration failed")
 
         log_success("Database migrations completed")
@@ -404,10 +537,15 @@ def run_backend_setup(context: InstallerContext):
     # Step 2: Run backend setup script
     log_info("Step 2/2: Creating directories and installing network filters...")
     try:
+        # The setup script may download ISOs for half an hour; stream its
+        # output rather than accumulating it all in memory
         result = run_command(
             "npm run setup",
             cwd=context.backend_dir,
-            timeout=1800  # 30 minutes for potential ISO downloads
+            timeout=1800,  # 30 minutes for potential ISO downloads
+            env=env,
+            check=False,
+            stream=True
         )
         if not result.success:
             log_error("Backend setup script failed")
@@ -415,8 +553,8 @@ def run_backend_setup(context: InstallerContext):
             log_error("  - Database connection is working")
             log_error("  - Backend .env file is correct")
             log_error("  - KVM is available: ls -la /dev/kvm")
-            if result.stderr:
-                log_error(f"Error output: {result.stderr}")
+            if result.stdout:
+                log_error(f"Last output:\n{result.stdout}")
             raise RuntimeError("Backend setup failed")
 
         log_success("Backend setup completed successfully")
@@ -436,8 +574,16 @@ def run_backend_setup(context: InstallerContext):
         ("Sockets directory", context.sockets_dir)
     ]
 
+    # All three directories live directly under data_dir, so one scandir
+    # pass replaces a stat per directory
+    try:
+        with os.scandir(context.data_dir) as entries:
+            present = {entry.path for entry in entries if entry.is_dir()}
+    except OSError:
+        present = set()
+
     for name, path in critical_dirs:
-        if os.path.exists(path):
+        if path in present:
             log_debug(f"✓ {name} created: {path}")
         else:
             log_warning(f"⚠ {name} not found: {path}")
@@ -473,35 +619,24 @@ def create_systemd_service(
         log_info(f"  WorkingDirectory: {working_dir}")
         return
 
-    # Build systemd service file content
-    service_content = f"""[Unit]
-Description={description}
-After=network.target postgresql.service
-Requires=postgresql.service
-
-[Service]
-Type=simple
-User=root
-WorkingDirectory={working_dir}
-ExecStart={exec_start}
-Restart=always
-RestartSec=10
-StandardOutput=journal
-StandardError=journal
-Environment="NODE_ENV=production"
-Environment="PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
-
-[Install]
-WantedBy=multi-user.target
-"""
+    # Interleave the pre-encoded static boilerplate with the per-service
+    # values; the buffers are gathered into the file in one writev
+    values = {
+        'description': description,
+        'working_dir': working_dir,
+        'exec_start': exec_start,
+    }
+    service_content = []
+    for static_chunk, field in zip(SERVICE_STATIC_CHUNKS, SERVICE_FIELD_ORDER):
+        if static_chunk:
+            service_content.append(static_chunk)
+        service_content.append(values[field].encode('utf-8'))
+    service_content.append(SERVICE_STATIC_CHUNKS[-1])
 
     try:
         service_path = f"/etc/systemd/system/{name}.service"
-        with open(service_path, 'w') as f:
-            f.write(service_content)
-
-        # Set standard service file permissions
-        os.chmod(service_path, 0o644)
+        # Standard service file permissions
+        _write_config_file(service_path, service_content, 0o644)
 
         log_success(f"Service file created: {service_path}")
 
@@ -514,98 +649,77 @@ WantedBy=multi-user.target
         raise
 
 
-def enable_and_start_service(name: str, context: InstallerContext):
-    """
-    Enable and start systemd service.
+def _report_service_failure(name: str):
+    """Log detailed status for a service that failed to start."""
+    status_result = run_command(["systemctl", "status", name], timeout=10, check=False)
+    log_error(f"Service {name} failed to start")
+    log_error("Service status:")
+    if status_result.stdout:
+        for line in status_result.stdout.split('\n')[:15]:
+            log_error(f"  {line}")
+    log_error("Check logs with:")
+    log_error(f"  journalctl -u {name} -n 50 --no-pager")
 
-    Executes:
-    - systemctl daemon-reload
-    - systemctl enable {name}
-    - systemctl start {name}
-    - systemctl is-active {name}
 
-    Args:
-        name: Service name to enable and start
-        context: Installation configuration context
+def _wait_for_services_activation(names: list, max_wait_seconds: int = 30):
     """
-    log_info(f"Enabling and starting service: {name}...")
+    Poll systemd until all started services report active.
 
-    if context.dry_run:
-        log_info(f"[DRY RUN] Would execute:")
-        log_info("  systemctl daemon-reload")
-        log_info(f"  systemctl enable {name}")
-        log_info(f"  systemctl start {name}")
-        log_info(f"  systemctl is-active {name}")
-        return
-
-    try:
-        # Reload systemd daemon to pick up new service files
-        result = run_command("systemctl daemon-reload", timeout=30)
-        if not result.success:
-            log_warning("Failed to reload systemd daemon, continuing anyway...")
+    Node.js services can take time to initialize, so this retries
+    `systemctl is-active` until every service settles or the timeout is
+    reached. All still-pending units are passed to a single is-active
+    invocation per poll (systemctl prints one status line per unit), so
+    each round costs one fork regardless of service count. A failed
+    state raises immediately with diagnostics.
 
-        # Enable service (start on boot)
-        result = run_command(f"systemctl enable {name}", timeout=30)
-        if result.success:
-            log_debug(f"Service {name} enabled")
-        else:
-            log_warning(f"Failed to enable service (may already be enabled)")
-
-        # Start service
-        result = run_command(f"systemctl start {name}", timeout=30)
-        if not result.success:
-            log_error(f"Failed to start service {name}")
-            log_error("Check service logs with:")
-            log_error(f"  journalctl -u {name} -n 50")
-            if result.stderr:
-                log_error(f"Error: {result.stderr}")
-            raise RuntimeError(f"Failed to start {name}")
-
-        log_debug(f"Service {name} started")
-
-        # Wait for service to activate (with retries)
-        # Node.js services can take time to initialize
-        max_wait_seconds = 30
-        check_interval = 2
-        elapsed = 0
-
-        log_info(f"Waiting for {name} to activate (timeout: {max_wait_seconds}s)...")
-
-        while elapsed < max_wait_seconds:
-            result = run_command(f"systemctl is-active {name}", timeout=10, check=False)
-            status = result.stdout.strip()
+    Args:
+        names: Service names to wait for
+        max_wait_seconds: Maximum time to wait before giving up
 
+    Raises:
+        RuntimeError: If any service enters the failed state
+    """
+    # Poll with a short initial interval that ramps up to 2s. sd_notify
+    # readiness is not an option here (the npm-launched units are
+    # Type=simple and do not notify), but Type=simple units usually report
+    # active on the very first check, so the common case returns without
+    # sleeping at all and slow starts degrade to the old 2s cadence.
+    check_interval = 0.5
+    elapsed = 0.0
+    pending = list(names)
+
+    log_info(f"Waiting for {', '.join(names)} to activate (timeout: {max_wait_seconds}s)...")
+
+    while pending and elapsed < max_wait_seconds:
+        result = run_command(["systemctl", "is-active", *pending], timeout=10, check=False)
+        statuses = result.stdout.strip().split('\n')
+
+        still_pending = []
+        for name, status in zip(pending, statuses):
+            status = status.strip()
             if status == "active":
                 log_success(f"Service {name} is running")
                 log_info(f"Service {name} enabled and started successfully")
-                return
-            elif status == "activating":
-                log_debug(f"Service {name} is still activating... ({elapsed}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
             elif status == "failed":
-                # Service failed to start - get detailed status
-                status_result = run_command(f"systemctl status {name}", timeout=10, check=False)
-                log_error(f"Service {name} failed to start")
-                log_error("Service status:")
-                if status_result.stdout:
-                    for line in status_result.stdout.split('\n')[:15]:
-                        log_error(f"  {line}")
-                log_error("Check logs with:")
-                log_error(f"  journalctl -u {name} -n 50 --no-pager")
+                _report_service_failure(name)
                 raise RuntimeError(f"Service {name} failed to start")
             else:
-                # Unknown status - wait and retry
-                log_debug(f"Service {name} status: {status} ({elapsed}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
-
-        # Timeout reached - service still not active
+                # activating or unknown - keep waiting
+                log_debug(f"Service {name} status: {status} ({elapsed:.1f}s)")
+                still_pending.append(name)
+
+        pending = still_pending
+        if pending:
+            time.sleep(check_interval)
+            elapsed += check_interval
+            check_interval = min(check_interval * 2, 2)
+
+    # Timeout reached - some services still not active
+    for name in pending:
         log_warning(f"Service {name} did not fully activate within {max_wait_seconds}s")
-        log_warning(f"Current status: {status}")
 
         # Get detailed status for debugging
-        status_result = run_command(f"systemctl status {name}", timeout=10, check=False)
+        status_result = run_command(["systemctl", "status", name], timeout=10, check=False)
         log_warning("Service status:")
         if status_result.stdout:
             for line in status_result.stdout.split('\n')[:15]:
@@ -615,11 +729,56 @@ def enable_and_start_service(name: str, context: InstallerContext):
         log_info(f"Check status with: systemctl status {name}")
         log_info(f"Check logs with: journalctl -u {name} -n 50 --no-pager")
 
+
+def enable_and_start_services(names: list, context: InstallerContext):
+    """
+    Enable and start systemd services in a single systemctl invocation.
+
+    Executes:
+    - systemctl enable --now {name...} (one call, all services)
+    - systemctl is-active {name} (per service, until active)
+
+    Passing all units to one `enable --now` lets systemd start them in
+    parallel instead of serializing one fork per service. Note that
+    `systemctl daemon-reload` is run once for the whole phase in
+    create_services() after all unit files are written.
+
+    Args:
+        names: Service names to enable and start
+        context: Installation configuration context
+    """
+    log_info(f"Enabling and starting services: {', '.join(names)}...")
+
+    if context.dry_run:
+        log_info(f"[DRY RUN] Would execute:")
+        log_info(f"  systemctl enable --now {' '.join(names)}")
+        for name in names:
+            log_info(f"  systemctl is-active {name}")
+        return
+
+    try:
+        # Enable (start on boot) and start all services in one invocation
+        result = run_command(["systemctl", "enable", "--now", *names], timeout=30, check=False)
+        if not result.success:
+            log_error(f"Failed to start services: {', '.join(names)}")
+            log_error("Check service logs with:")
+            for name in names:
+                log_error(f"  journalctl -u {name} -n 50")
+            if result.stderr:
+                log_error(f"Error: {result.stderr}")
+            raise RuntimeError(f"Failed to start {', '.join(names)}")
+
+        log_debug(f"Services started: {', '.join(names)}")
+
+        # Services are now starting concurrently; wait for all of them
+        # with one batched is-active poll
+        _wait_for_services_activation(names)
+
     except subprocess.TimeoutExpired:
-        log_error(f"Systemctl command timed out for service {name}")
+        log_error("Systemctl command timed out while starting services")
         raise
     except Exception as e:
-        log_error(f"Failed to enable/start service {name}: {e}")
+        log_error(f"Failed to enable/start services: {e}")
         raise
 
 
@@ -671,21 +830,29 @@ def create_services(context: InstallerContext):
     # Phase 5b: Generate configuration files
     log_section("Generating Configuration Files")
     try:
-        generate_backend_env(context)
-        generate_frontend_env(context)
+        # The two .env generations (and their dev-mode ownership
+        # restoration) are independent writes to different directories;
+        # overlap them so one slow disk flush does not serialize the other.
+        def generate_and_restore(generator, target_dir):
+            generator(context)
+            if original_owner:
+                try:
+                    env_file = os.path.join(target_dir, '.env')
+                    if os.path.exists(env_file):
+                        os.chown(env_file, original_owner[0], original_owner[1])
+                except Exception as e:
+                    log_warning(f"Failed to restore .env ownership: {e}")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backend_future = executor.submit(
+                generate_and_restore, generate_backend_env, context.backend_dir)
+            frontend_future = executor.submit(
+                generate_and_restore, generate_frontend_env, context.frontend_dir)
+            backend_future.result()
+            frontend_future.result()
 
-        # Restore ownership of .env files in dev mode
         if original_owner:
-            try:
-                backend_env = os.path.join(context.backend_dir, '.env')
-                frontend_env = os.path.join(context.frontend_dir, '.env')
-                if os.path.exists(backend_env):
-                    os.chown(backend_env, original_owner[0], original_owner[1])
-                if os.path.exists(frontend_env):
-                    os.chown(frontend_env, original_owner[0], original_owner[1])
-                log_debug("Restored ownership of .env files")
-            except Exception as e:
-                log_warning(f"Failed to restore .env ownership: {e}")
+            log_debug("Restored ownership of .env files")
 
         log_success("Configuration files generated")
     except Exception as e:
@@ -712,11 +879,11 @@ def create_services(context: InstallerContext):
         # Restore ownership of setup directories in dev mode
         if original_owner:
             try:
+                # restore_ownership walks each tree and yields nothing for
+                # missing directories, so no per-directory exists() probe
                 setup_dirs = ['iso', 'temp', 'uefi', 'disks', 'sockets', 'wallpapers']
                 for dir_name in setup_dirs:
-                    dir_path = os.path.join(context.data_dir, dir_name)
-                    if os.path.exists(dir_path):
-                        restore_ownership(dir_path, original_owner)
+                    restore_ownership(os.path.join(context.data_dir, dir_name), original_owner)
                 log_info("Restored ownership of setup directories to original user")
             except Exception as e:
                 log_warning(f"Failed to restore setup directory ownership: {e}")
@@ -735,23 +902,34 @@ def create_services(context: InstallerContext):
     # Phase 5e: Create systemd services
     log_section("Creating Systemd Services")
     try:
-        # Create backend service
-        create_systemd_service(
-            name="infinibay-backend",
-            exec_start="/usr/bin/npm run start",
-            working_dir=context.backend_dir,
-            description="Infinibay Backend API Server",
-            context=context
-        )
-
-        # Create frontend service
-        create_systemd_service(
-            name="infinibay-frontend",
-            exec_start="/usr/bin/npm run start",
-            working_dir=context.frontend_dir,
-            description="Infinibay Frontend Web Interface",
-            context=context
-        )
+        # Both unit files are independent; write them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            backend_future = executor.submit(
+                create_systemd_service,
+                name="infinibay-backend",
+                exec_start="/usr/bin/npm run start",
+                working_dir=context.backend_dir,
+                description="Infinibay Backend API Server",
+                context=context
+            )
+            frontend_future = executor.submit(
+                create_systemd_service,
+                name="infinibay-frontend",
+                exec_start="/usr/bin/npm run start",
+                working_dir=context.frontend_dir,
+                description="Infinibay Frontend Web Interface",
+                context=context
+            )
+            backend_future.result()
+            frontend_future.result()
+
+        # Reload systemd once so it picks up both new unit files
+        if context.dry_run:
+            log_info("[DRY RUN] Would run: systemctl daemon-reload")
+        else:
+            result = run_command(["systemctl", "daemon-reload"], timeout=30, check=False)
+            if not result.success:
+                log_warning("Failed to reload systemd daemon, continuing anyway...")
 
         log_success("Systemd services created")
     except Exception as e:
@@ -762,11 +940,9 @@ def create_services(context: InstallerContext):
     # Phase 5f: Enable and start services
     log_section("Starting Services")
     try:
-        # Start backend
-        enable_and_start_service("infinibay-backend", context)
-
-        # Start frontend
-        enable_and_start_service("infinibay-frontend", context)
+        # Start backend and frontend together; systemd runs both startups
+        # in parallel from a single systemctl call
+        enable_and_start_services(["infinibay-backend", "infinibay-frontend"], context)
 
         log_success("All services started successfully")
     except Exception as e:
@@ -782,12 +958,16 @@ def create_services(context: InstallerContext):
     log_success("🎉 INFINIBAY INSTALLATION COMPLETED SUCCESSFULLY! 🎉")
     log_success("="*70 + "\n")
 
-    # Installation summary
-    log_info("Installation Summary:")
-    log_info(f"  Code Directory: {context.install_dir}")
+    # Installation summary - consecutive same-level lines are joined and
+    # emitted through one log call per block (one stdout write each)
+    summary_lines = [
+        "Installation Summary:",
+        f"  Code Directory: {context.install_dir}",
+    ]
     if context.data_dir != context.install_dir:
-        log_info(f"  Data Directory: {context.data_dir}")
-    log_info(f"  Host IP Address: {context.host_ip}")
+        summary_lines.append(f"  Data Directory: {context.data_dir}")
+    summary_lines.append(f"  Host IP Address: {context.host_ip}")
+    log_info("\n".join(summary_lines))
 
     # Check infinization directories
     infinization_base = "/var/lib/infinization"
@@ -805,55 +985,68 @@ def create_services(context: InstallerContext):
     log_info("")
 
     # Access URLs
-    log_info("Access URLs:")
-    log_info(f"  Frontend (Web UI): {context.frontend_url}")
-    log_info(f"  Backend API: {context.backend_url}")
-    log_info(f"  GraphQL Playground: {context.graphql_url}")
+    log_info("\n".join([
+        "Access URLs:",
+        f"  Frontend (Web UI): {context.frontend_url}",
+        f"  Backend API: {context.backend_url}",
+        f"  GraphQL Playground: {context.graphql_url}",
+    ]))
     log_info("")
 
     # Database credentials
-    log_info("Database Configuration:")
-    log_info(f"  Host: {context.db_host}:{context.db_port}")
-    log_info(f"  Database: {context.db_name}")
-    log_info(f"  User: {context.db_user}")
-    log_info(f"  Password: {context.db_password}")
+    log_info("\n".join([
+        "Database Configuration:",
+        f"  Host: {context.db_host}:{context.db_port}",
+        f"  Database: {context.db_name}",
+        f"  User: {context.db_user}",
+        f"  Password: {context.db_password}",
+    ]))
     log_warning("  ⚠️  Save these credentials securely!")
     log_info("")
 
     # Admin user credentials
-    log_info("Admin User Credentials:")
-    log_info(f"  Email: {context.admin_email}")
-    log_info(f"  Password: {context.admin_password}")
+    log_info("\n".join([
+        "Admin User Credentials:",
+        f"  Email: {context.admin_email}",
+        f"  Password: {context.admin_password}",
+    ]))
     log_warning("  ⚠️  Change these credentials after first login!")
     log_info("")
 
     # Service management
-    log_info("Service Management:")
-    log_info("  Check status: systemctl status infinibay-backend infinibay-frontend")
-    log_info("  View logs: journalctl -u infinibay-backend -f")
-    log_info("  Restart: systemctl restart infinibay-backend infinibay-frontend")
-    log_info("  Stop: systemctl stop infinibay-backend infinibay-frontend")
+    log_info("\n".join([
+        "Service Management:",
+        "  Check status: systemctl status infinibay-backend infinibay-frontend",
+        "  View logs: journalctl -u infinibay-backend -f",
+        "  Restart: systemctl restart infinibay-backend infinibay-frontend",
+        "  Stop: systemctl stop infinibay-backend infinibay-frontend",
+    ]))
     log_info("")
 
     # Next steps
-    log_info("Next Steps:")
-    log_info(f"  1. Open your browser and navigate to: {context.frontend_url}")
-    log_info("  2. Create your first admin user account")
-    log_info("  3. Verify network bridge is configured (should be automatic)")
-    log_info("  4. Start creating virtual machines!")
+    log_info("\n".join([
+        "Next Steps:",
+        f"  1. Open your browser and navigate to: {context.frontend_url}",
+        "  2. Create your first admin user account",
+        "  3. Verify network bridge is configured (should be automatic)",
+        "  4. Start creating virtual machines!",
+    ]))
     log_info("")
 
     # Important notes
-    log_warning("Important Notes:")
-    log_warning("  • Services will start automatically on system boot")
-    log_warning("  • Backend .env contains sensitive data (DATABASE_URL, TOKENKEY)")
-    log_warning("  • Ensure your firewall allows access to ports:")
-    log_warning(f"    - Frontend: {context.frontend_port}")
-    log_warning(f"    - Backend: {context.backend_port}")
+    notes_lines = [
+        "Important Notes:",
+        "  • Services will start automatically on system boot",
+        "  • Backend .env contains sensitive data (DATABASE_URL, TOKENKEY)",
+        "  • Ensure your firewall allows access to ports:",
+        f"    - Frontend: {context.frontend_port}",
+        f"    - Backend: {context.backend_port}",
+    ]
     if context.skip_isos:
-        log_warning("  • ISO downloads were skipped. You may need to download them manually.")
+        notes_lines.append("  • ISO downloads were skipped. You may need to download them manually.")
     if not os.path.exists("/dev/kvm"):
-        log_warning("  • KVM is not available - verify virtualization before creating VMs")
+        notes_lines.append("  • KVM is not available - verify virtualization before creating VMs")
+    log_warning("\n".join(notes_lines))
     log_info("")
 
     # Final message
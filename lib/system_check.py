@@ -10,17 +10,21 @@ This module handles installation of required system packages:
 """
 
 import os
+import pwd
+import random
 import subprocess
+import tempfile
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
 
 from .config import InstallerContext
-from .logger import log_step, log_info, log_success, log_warning, log_error, log_debug, log_section
-from .os_detect import OSType, get_package_manager
+from .logger import log_step, log_info, log_success, log_warning, log_error, log_debug
+from .os_detect import OSType
 from .utils import run_command, command_exists, get_command_version
 
 # Package names by OS type
-UBUNTU_PACKAGES = [
+UBUNTU_PACKAGES = (
     'nodejs',
     'npm',
     'postgresql',
@@ -35,9 +39,9 @@ UBUNTU_PACKAGES = [
     'p7zip-full',
     'mingw-w64',  # Windows cross-compilation toolchain for infiniservice.exe
     'curl',  # Required for rustup installation
-]
+)
 
-FEDORA_PACKAGES = [
+FEDORA_PACKAGES = (
     'nodejs',
     'npm',
     'postgresql',
@@ -53,43 +57,98 @@ FEDORA_PACKAGES = [
     'p7zip',
     'mingw64-gcc',  # Windows cross-compilation toolchain for infiniservice.exe
     'curl',  # Required for rustup installation
-]
+)
 
 # Commands that must be available after installation
 # Note: rustc and cargo are installed via rustup, not system packages
-REQUIRED_COMMANDS = [
+REQUIRED_COMMANDS = (
     'node',
     'npm',
     'psql',
     'qemu-system-x86_64',
-]
+)
 
+# PostgreSQL cluster location (Fedora layout); the marker paths are
+# built once at import instead of on every init check
+_PG_DATA_DIR = '/var/lib/pgsql/data'
+_PG_VERSION_MARKER = f"{_PG_DATA_DIR}/PG_VERSION"
+_PG_BASE_DIR = f"{_PG_DATA_DIR}/base"
 
-def update_package_cache(context: InstallerContext):
+
+def _has_ipv4_default_route() -> bool:
+    """
+    Return True when the host has an IPv4 default route.
+
+    Gates the IPv4-forcing package manager flags: they eliminate long
+    AAAA-first connect stalls on networks with broken IPv6, but would
+    strand an IPv6-only host entirely.
+    """
+    try:
+        with open('/proc/net/route') as f:
+            next(f, None)  # header line
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 2 and fields[1] == '00000000':
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def update_package_cache(context: InstallerContext, env: Optional[dict] = None):
     """Update the package manager cache."""
-    pkg_manager = get_package_manager(context.os_info.os_type)
+    pkg_manager = context.package_manager
     log_info("Updating package cache...")
 
     if context.dry_run:
         log_info(f"[DRY RUN] Would run: {pkg_manager} update/check-update")
         return
 
+    # Skip the 5-30s network round-trip when the metadata cache is fresh;
+    # a re-run minutes after the last one gains nothing from refreshing
+    if not context.force_cache_refresh:
+        cache_marker = '/var/cache/apt/pkgcache.bin' if pkg_manager == 'apt' else '/var/cache/dnf'
+        try:
+            if time.time() - os.stat(cache_marker).st_mtime < 3600:
+                log_info("Package cache is fresh (<1h old), skipping update")
+                log_debug("Use --force-cache-refresh to update anyway")
+                return
+        except OSError:
+            pass
+
+    if env is None:
+        env = {**os.environ, 'DEBIAN_FRONTEND': 'noninteractive', 'APT_LISTCHANGES_FRONTEND': 'none'}
+
+    # Forcing IPv4 skips 20s+ AAAA-first connect stalls on broken-IPv6
+    # networks; only applied when an IPv4 default route exists
+    force_ipv4 = _has_ipv4_default_route()
+
     max_retries = 3
     for attempt in range(max_retries):
         try:
             if pkg_manager == "apt":
-                env = os.environ.copy()
-                env['DEBIAN_FRONTEND'] = 'noninteractive'
-                run_command("apt update", env=env, timeout=300)
+                cmd = ['apt', 'update']
+                if force_ipv4:
+                    cmd[1:1] = ['-o', 'Acquire::ForceIPv4=true']
+                run_command(cmd, env=env, timeout=300)
                 break
             elif pkg_manager == "dnf":
                 # dnf check-update returns 100 if updates are available, which is normal
-                run_command("dnf check-update", check=False, timeout=300)
+                cmd = ['dnf', 'check-update',
+                       '--setopt=max_parallel_downloads=10',
+                       '--setopt=fastestmirror=True']
+                if force_ipv4:
+                    cmd.append('--setopt=ip_resolve=4')
+                run_command(cmd, check=False, timeout=300)
                 break
         except subprocess.CalledProcessError as e:
             if attempt < max_retries - 1:
-                log_warning(f"Package cache update failed (attempt {attempt + 1}/{max_retries}), retrying in 5 seconds...")
-                time.sleep(5)
+                # Exponential backoff (0.5s, 1s, ...) with jitter: a DNS
+                # blip clears in well under the old fixed 5 seconds, and
+                # the jitter avoids hammering a recovering mirror in sync
+                delay = min(0.5 * (2 ** attempt) + random.uniform(0, 0.5), 10)
+                log_warning(f"Package cache update failed (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
             else:
                 raise RuntimeError(f"Failed to update package cache after {max_retries} attempts: {e}")
         except subprocess.TimeoutExpired:
@@ -98,9 +157,47 @@ def update_package_cache(context: InstallerContext):
     log_success("Package cache updated")
 
 
-def install_packages(context: InstallerContext):
+def _filter_missing_packages(pkg_manager: str, packages: Sequence[str]) -> list:
+    """
+    Return the subset of packages that are not yet installed.
+
+    On installer re-runs most (often all) packages are already present;
+    asking dpkg/rpm once up front lets the install transaction be skipped
+    or shrunk. If the query fails for any reason the full list is
+    returned so installation proceeds as before.
+    """
+    try:
+        if pkg_manager == "apt":
+            result = run_command(
+                ["dpkg-query", "-W", "-f=${Package} ${Status}\n", *packages],
+                check=False, capture_output=True
+            )
+            # Lines look like "nodejs install ok installed"; a package
+            # known to dpkg but removed reports a different status, and
+            # multiarch entries carry a ":amd64"-style suffix to strip
+            installed = set()
+            for line in result.stdout.splitlines():
+                parts = line.split()
+                if len(parts) >= 4 and parts[-1] == 'installed':
+                    installed.add(parts[0].split(':', 1)[0])
+        else:
+            result = run_command(
+                ["rpm", "-q", "--qf", "%{NAME}\n", *packages],
+                check=False, capture_output=True
+            )
+            # Installed packages print their bare name; missing ones print
+            # a "package X is not installed" sentence that never matches
+            package_set = set(packages)
+            installed = {line for line in result.stdout.splitlines() if line in package_set}
+    except Exception:
+        return list(packages)
+
+    return [pkg for pkg in packages if pkg not in installed]
+
+
+def install_packages(context: InstallerContext, env: Optional[dict] = None):
     """Install required system packages."""
-    pkg_manager = get_package_manager(context.os_info.os_type)
+    pkg_manager = context.package_manager
 
     if context.os_info.os_type == OSType.UBUNTU:
         packages = UBUNTU_PACKAGES
@@ -114,29 +211,88 @@ def install_packages(context: InstallerContext):
         log_info(f"[DRY RUN] Would install: {', '.join(packages)}")
         return
 
+    # Skip packages that are already installed (hot path on re-runs)
+    missing = _filter_missing_packages(pkg_manager, packages)
+    if not missing:
+        log_success("All required packages already installed")
+        return
+    if len(missing) < len(packages):
+        log_info(f"{len(packages) - len(missing)} packages already installed, installing {len(missing)}")
+    packages = missing
+
+    # Build the environment once; copying os.environ inside the retry loop
+    # was pure waste and made attempts see potentially different envs
+    if env is None:
+        env = {**os.environ, 'DEBIAN_FRONTEND': 'noninteractive', 'APT_LISTCHANGES_FRONTEND': 'none'}
+
+    # Format the display string once; the argv lists below go straight to
+    # exec without a shell parse, so no re-joining per retry
+    pkg_display = ' '.join(packages)
+
+    # Same IPv4 gating as update_package_cache: avoid AAAA-first connect
+    # stalls without breaking IPv6-only hosts
+    force_ipv4 = _has_ipv4_default_route()
+    apt_ipv4 = ['-o', 'Acquire::ForceIPv4=true'] if force_ipv4 else []
+    dnf_ipv4 = ['--setopt=ip_resolve=4'] if force_ipv4 else []
+
+    if pkg_manager == "apt":
+        # Prefetch the archives first so the network-bound step is isolated:
+        # a flaky mirror only re-runs this cheap download, and the install
+        # below becomes a mostly-local unpack. apt holds a global archive
+        # lock, so the fetch cannot overlap the cache update itself.
+        # Strictly best-effort: run_command re-raises TimeoutExpired even
+        # with check=False, and a slow mirror must fall through to the
+        # retried install, not abort the phase. The 900s cap also keeps
+        # the worst-case wall time at 1800+900s rather than doubling it.
+        try:
+            prefetch = run_command(
+                ['apt-get', *apt_ipv4, 'install', '-y', '--download-only', '--no-install-recommends', *packages],
+                env=env, check=False, timeout=900
+            )
+            if not prefetch.success:
+                log_debug("Package pre-download failed; install will fetch directly")
+        except subprocess.TimeoutExpired:
+            log_debug("Package pre-download timed out; install will fetch directly")
+
     max_retries = 2
     for attempt in range(max_retries + 1):
         try:
             if pkg_manager == "apt":
-                env = os.environ.copy()
-                env['DEBIAN_FRONTEND'] = 'noninteractive'
-                cmd = f"apt install -y {' '.join(packages)}"
-                run_command(cmd, env=env, timeout=1800)
+                # Recommends roughly double the download and the number of
+                # dpkg configure scriptlets; everything Infinibay needs is
+                # a hard dependency or listed explicitly above
+                cmd_display = f"apt install -y --no-install-recommends {pkg_display}"
+                run_command(['apt', *apt_ipv4, 'install', '-y', '--no-install-recommends', *packages], env=env, timeout=1800)
                 break
             elif pkg_manager == "dnf":
-                cmd = f"dnf install -y {' '.join(packages)}"
-                run_command(cmd, timeout=1800)
+                cmd_display = f"dnf install -y {pkg_display}"
+                # Per-invocation setopts: stock Fedora caps downloads at 3
+                # connections; the install step is mirror-latency bound
+                run_command(
+                    ['dnf', 'install', '-y',
+                     '--setopt=max_parallel_downloads=10',
+                     '--setopt=fastestmirror=True',
+                     '--setopt=install_weak_deps=False',
+                     '--setopt=tsflags=nodocs',
+                     *dnf_ipv4,
+                     *packages],
+                    timeout=1800
+                )
                 break
         except subprocess.CalledProcessError as e:
             if attempt < max_retries:
-                log_warning(f"Package installation failed (attempt {attempt + 1}/{max_retries + 1}), retrying...")
-                time.sleep(10)
+                # Jittered exponential backoff: a transient dpkg/rpm lock
+                # clears quickly, and the jitter keeps a fleet of
+                # installers from retrying against a mirror in lock-step
+                delay = min(random.uniform(1, 2) * (2 ** attempt), 60)
+                log_warning(f"Package installation failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay}s...")
+                time.sleep(delay)
             else:
                 raise RuntimeError(
                     f"Failed to install packages after {max_retries + 1} attempts.\n"
                     f"Error: {e}\n"
                     f"Please install manually using:\n"
-                    f"  sudo {cmd}"
+                    f"  sudo {cmd_display}"
                 )
         except subprocess.TimeoutExpired:
             raise RuntimeError(
@@ -147,24 +303,53 @@ def install_packages(context: InstallerContext):
     log_success("All packages installed successfully")
 
 
+def _probe_command(cmd: str):
+    """Check one command's availability and version (thread-pool worker)."""
+    exists = command_exists(cmd)
+    return cmd, exists, get_command_version(cmd) if exists else None
+
+
 def verify_installations(context: InstallerContext):
     """Verify that all required commands are available."""
     log_info("Verifying installations...")
 
+    # Probe all commands concurrently; each probe mostly waits on a
+    # --version subprocess. Log lines are emitted afterwards in
+    # REQUIRED_COMMANDS order so the output stays deterministic.
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_COMMANDS)) as executor:
+        results = list(executor.map(_probe_command, REQUIRED_COMMANDS))
+
     failed_commands = []
+    versions = {}
 
-    for cmd in REQUIRED_COMMANDS:
-        if not command_exists(cmd):
+    for cmd, exists, version in results:
+        if not exists:
             log_error(f"Required command not found: {cmd}")
             failed_commands.append(cmd)
         else:
-            version = get_command_version(cmd)
+            versions[cmd] = version
             log_debug(f"✓ {cmd}: {version}")
 
-    # Special check for Node.js version - ENFORCED requirement
-    if command_exists('node'):
+    # Special check for Node.js version - ENFORCED requirement.
+    # Reuse the version captured above instead of forking node again.
+    node_version_output = versions.get('node')
+    if node_version_output is None and 'node' not in failed_commands:
+        # The pooled probe is capped at 3s and runs alongside disk-heavy
+        # work, so it can come back empty under load; re-probe serially
+        # with a generous timeout rather than dropping the gate.
+        try:
+            reprobe = run_command('node --version', check=False, timeout=30)
+            if reprobe.success:
+                node_version_output = reprobe.stdout.strip().split('\n')[0]
+        except subprocess.TimeoutExpired:
+            pass
+        if not node_version_output:
+            log_warning(
+                "Could not determine Node.js version; unable to verify the "
+                "Node.js >= 18 requirement"
+            )
+    if node_version_output:
         try:
-            node_version_output = get_command_version('node')
             # Extract version number (e.g., "v18.20.0" -> 18)
             version_parts = node_version_output.strip().lstrip('v').split('.')
             major_version = int(version_parts[0])
@@ -207,9 +392,21 @@ def initialize_postgresql(context: InstallerContext):
 
     log_info("Initializing PostgreSQL...")
 
-    pg_data_dir = Path("/var/lib/pgsql/data/PG_VERSION")
+    # The cluster is initialized if the PG_VERSION marker exists, or if
+    # the base directory already has contents (a partially-failed initdb
+    # should not trigger a 60-second re-init on every re-run)
+    initialized = False
+    try:
+        os.stat(_PG_VERSION_MARKER)
+        initialized = True
+    except FileNotFoundError:
+        try:
+            with os.scandir(_PG_BASE_DIR) as entries:
+                initialized = next(iter(entries), None) is not None
+        except FileNotFoundError:
+            pass
 
-    if pg_data_dir.exists():
+    if initialized:
         log_info("PostgreSQL already initialized, skipping")
         return
 
@@ -228,40 +425,61 @@ def initialize_postgresql(context: InstallerContext):
             log_warning(f"PostgreSQL initialization may have failed: {e}")
 
 
-def enable_and_start_services(context: InstallerContext):
-    """Enable and start required system services."""
-    log_info("Enabling and starting services...")
+def _systemd_available() -> bool:
+    """
+    Return True when systemd is the running init.
 
-    services = ['postgresql']
+    /run/systemd/system exists exactly when systemd booted the machine
+    (the sd_booted() convention). In containers or chroots without
+    systemd, every systemctl call would just burn its timeout.
+    """
+    return os.path.isdir('/run/systemd/system')
 
-    for service in services:
-        if context.dry_run:
-            log_info(f"[DRY RUN] Would enable and start: {service}")
-            continue
 
-        try:
-            # Enable service
-            run_command(f"systemctl enable {service}", timeout=30)
-            log_debug(f"Enabled {service}")
+def enable_and_start_services(context: InstallerContext, sudo_user: Optional[str] = None):
+    """Enable and start required system services."""
+    log_info("Enabling and starting services...")
 
-            # Start service
-            run_command(f"systemctl start {service}", timeout=30)
-            log_debug(f"Started {service}")
+    if sudo_user is None:
+        sudo_user = os.environ.get('SUDO_USER')
 
-            # Verify service is running
-            run_command(f"systemctl is-active {service}", timeout=10)
-            log_success(f"✓ {service} is running")
+    services = ['postgresql']
 
-        except subprocess.CalledProcessError as e:
-            # Service may already be running
+    if context.dry_run:
+        for service in services:
+            log_info(f"[DRY RUN] Would enable and start: {service}")
+    elif not _systemd_available():
+        log_warning(
+            "No systemd detected (container or chroot?); skipping service "
+            f"management. Start manually: {', '.join(services)}"
+        )
+    else:
+        # State-check first: on re-runs the units are usually already
+        # enabled and running, making this the whole function
+        enabled = run_command(["systemctl", "is-enabled", "--quiet", *services], timeout=10, check=False)
+        active = run_command(["systemctl", "is-active", "--quiet", *services], timeout=10, check=False)
+        if enabled.success and active.success:
+            for service in services:
+                log_success(f"✓ {service} is running")
+        else:
             try:
-                run_command(f"systemctl is-active {service}", timeout=10)
-                log_success(f"✓ {service} is already running")
-            except:
-                log_warning(f"Could not start {service}: {e}")
+                # Enable and start all services in a single systemctl call
+                run_command(["systemctl", "enable", "--now", *services], timeout=30)
+                log_debug(f"Enabled and started: {', '.join(services)}")
+            except subprocess.CalledProcessError as e:
+                # Services may already be running; the state check below decides
+                log_debug(f"systemctl enable --now reported an error: {e}")
+
+            # Verify all services with one is-active call (one status line per unit)
+            result = run_command(["systemctl", "is-active", *services], timeout=10, check=False)
+            statuses = result.stdout.strip().split('\n')
+            for service, status in zip(services, statuses):
+                if status.strip() == "active":
+                    log_success(f"✓ {service} is running")
+                else:
+                    log_warning(f"Could not start {service} (status: {status.strip()})")
 
     # Add current user to kvm group for /dev/kvm access
-    sudo_user = os.environ.get('SUDO_USER')
     if sudo_user and not context.dry_run:
         groups_added = []
         for group in ['kvm']:
@@ -303,6 +521,83 @@ def verify_mingw_installation(context: InstallerContext):
         )
 
 
+def _run_rustup_installer(sudo_user: Optional[str], timeout: int = 600):
+    """
+    Download the rustup installer to a temporary file, then run it locally.
+
+    Staging the script instead of piping curl straight into sh separates
+    the network step (short timeout, cheap to retry) from the install
+    step, and a dropped connection can never kill the installer
+    mid-execution. When installing for the invoking user, the sh process
+    drops privileges via Popen's user/group/extra_groups arguments
+    instead of paying for a `su -` PAM login shell.
+
+    The script is staged via tempfile.mkstemp rather than a fixed name
+    in /tmp: a predictable path could be pre-created by a local user and
+    rewritten between download and exec, which in a root-run installer
+    is arbitrary code execution. mkstemp gives an unpredictable,
+    exclusively-created file owned by us, and the contents go through
+    the already-open fd.
+
+    Raises:
+        subprocess.CalledProcessError: If the download or installer fails
+        subprocess.TimeoutExpired: If either step exceeds its timeout
+    """
+    fd, script_path = tempfile.mkstemp(prefix='rustup-init-', suffix='.sh')
+    try:
+        try:
+            download = run_command(
+                ['curl', '--proto', '=https', '--tlsv1.2', '-sSf',
+                 'https://sh.rustup.rs'],
+                timeout=60
+            )
+            os.write(fd, download.stdout.encode())
+            # The demoted installer process must be able to read the script
+            os.fchmod(fd, 0o644)
+        finally:
+            os.close(fd)
+    except BaseException:
+        try:
+            os.unlink(script_path)
+        except OSError:
+            pass
+        raise
+
+    sh_argv = ['sh', script_path, '-y', '--default-toolchain', 'stable']
+
+    demote = {}
+    env = None
+    if sudo_user and sudo_user != 'root':
+        pw = pwd.getpwnam(sudo_user)
+        env = {**os.environ, 'USER': sudo_user, 'LOGNAME': sudo_user, 'HOME': pw.pw_dir}
+        # This runs inside the post-install thread pool, and preexec_fn
+        # is not safe in the presence of threads (the forked child can
+        # deadlock before exec). Popen's user/group/extra_groups perform
+        # the same setgid/initgroups/setuid sequence safely in C.
+        demote = {
+            'user': pw.pw_uid,
+            'group': pw.pw_gid,
+            'extra_groups': os.getgrouplist(sudo_user, pw.pw_gid),
+        }
+
+    try:
+        installer = subprocess.Popen(sh_argv, env=env, **demote)
+        try:
+            returncode = installer.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            installer.kill()
+            installer.wait()
+            raise
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, ' '.join(sh_argv))
+    finally:
+        try:
+            os.unlink(script_path)
+        except OSError:
+            pass
+
+
 def install_rustup(context: InstallerContext):
     """
     Install rustup (Rust toolchain manager) and Rust stable toolchain.
@@ -319,18 +614,21 @@ def install_rustup(context: InstallerContext):
 
     # Check if rustup is already installed
     if command_exists('rustup'):
-        log_info("rustup already installed, updating...")
+        log_info("rustup already installed, checking for updates...")
         if not context.dry_run:
             try:
-                # Update rustup itself
-                run_command("rustup self update", timeout=300)
-                log_success("rustup updated")
-
-                # Update stable toolchain
-                run_command("rustup update stable", timeout=300)
-                log_success("Rust stable toolchain updated")
-
-                # Ensure stable is default
+                # `rustup check` reports update availability without
+                # downloading anything; when everything is current we skip
+                # 30+ seconds of update network I/O. `rustup self update`
+                # is gone entirely — rustup keeps itself current.
+                check = run_command("rustup check", check=False, timeout=60)
+                if check.success and 'Update available' not in check.stdout:
+                    log_success("Rust stable toolchain already up to date")
+                else:
+                    run_command("rustup update stable", timeout=300)
+                    log_success("Rust stable toolchain updated")
+
+                # Ensure stable is default (local metadata change, cheap)
                 run_command("rustup default stable", timeout=60)
                 log_success("Rust stable set as default")
 
@@ -348,7 +646,7 @@ def install_rustup(context: InstallerContext):
     if command_exists('cargo') or command_exists('rustc'):
         log_warning("Found system-installed Rust/Cargo packages")
         log_warning("Removing system Rust packages to install via rustup...")
-        pkg_manager = get_package_manager(context.os_info.os_type)
+        pkg_manager = context.package_manager
         if not context.dry_run:
             try:
                 if pkg_manager == "apt":
@@ -369,71 +667,55 @@ def install_rustup(context: InstallerContext):
     install_user = sudo_user if sudo_user else os.environ.get('USER', 'root')
 
     try:
-        # Download and run rustup installer
+        # Download and run rustup installer (streamed curl | sh, demoted
+        # to the invoking user so it installs into their home directory)
         log_info("Downloading rustup installer...")
-        rustup_cmd = "curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y --default-toolchain stable"
-
-        # Run as the actual user, not root
-        if sudo_user:
-            # Run as the sudo user to install in their home directory
-            env = os.environ.copy()
-            env['USER'] = sudo_user
-            env['HOME'] = f"/home/{sudo_user}" if sudo_user != 'root' else '/root'
-
-            run_command(
-                f"su - {sudo_user} -c '{rustup_cmd}'",
-                timeout=600,
-                env=env
-            )
-        else:
-            # Run as current user (already root or in script)
-            run_command(rustup_cmd, timeout=600, shell=True)
+        _run_rustup_installer(sudo_user)
 
         log_success("Rustup installed successfully")
 
-        # Add cargo to PATH for current session
+        # Add cargo to PATH for current session (skip if already present
+        # so a re-entered install doesn't grow PATH with duplicates)
         cargo_bin = f"/home/{sudo_user}/.cargo/bin" if sudo_user and sudo_user != 'root' else "/root/.cargo/bin"
-        os.environ['PATH'] = f"{cargo_bin}:{os.environ.get('PATH', '')}"
+        path_parts = os.environ.get('PATH', '').split(os.pathsep)
+        if cargo_bin not in path_parts:
+            os.environ['PATH'] = os.pathsep.join([cargo_bin, *path_parts])
+
+        # PATH changed; invalidate memoized command probes
+        command_exists.cache_clear()
+        get_command_version.cache_clear()
 
         # Verify rustup is available
         if not command_exists('rustup'):
             raise RuntimeError("rustup not found in PATH after installation")
 
-        # Install stable toolchain explicitly
+        # Install stable toolchain explicitly and set it as default. When
+        # installing for the invoking user, both commands share one su
+        # login session instead of paying the PAM + profile-sourcing cost
+        # twice.
         log_info("Installing Rust stable toolchain...")
         try:
             if sudo_user:
                 run_command(
-                    f"su - {sudo_user} -c 'rustup toolchain install stable'",
-                    timeout=600
+                    ['su', '-', sudo_user, '-c',
+                     'rustup toolchain install stable && rustup default stable'],
+                    timeout=660
                 )
             else:
                 run_command("rustup toolchain install stable", timeout=600)
-            log_success("Rust stable toolchain installed")
-        except subprocess.CalledProcessError as e:
-            log_error(f"Failed to install Rust stable toolchain: {e}")
-            raise RuntimeError("Failed to install Rust stable toolchain")
-
-        # Set stable as default toolchain
-        log_info("Setting stable as default Rust toolchain...")
-        try:
-            if sudo_user:
-                run_command(
-                    f"su - {sudo_user} -c 'rustup default stable'",
-                    timeout=60
-                )
-            else:
                 run_command("rustup default stable", timeout=60)
-            log_success("Rust stable set as default toolchain")
+            log_success("Rust stable toolchain installed and set as default")
         except subprocess.CalledProcessError as e:
-            log_error(f"Failed to set default toolchain: {e}")
-            raise RuntimeError("Failed to set default Rust toolchain")
+            log_error(f"Failed to set up Rust stable toolchain: {e}")
+            raise RuntimeError("Failed to install and configure Rust stable toolchain")
 
-        # Verify installation
+        # Verify installation (probe the three binaries concurrently,
+        # report in order)
         log_info("Verifying Rust installation...")
-        for cmd in ['rustup', 'rustc', 'cargo']:
-            if command_exists(cmd):
-                version = get_command_version(cmd)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            rust_results = list(executor.map(_probe_command, ('rustup', 'rustc', 'cargo')))
+        for cmd, exists, version in rust_results:
+            if exists:
                 log_success(f"✓ {cmd}: {version}")
             else:
                 raise RuntimeError(f"{cmd} not found after rustup installation")
@@ -457,27 +739,27 @@ def check_kvm_support(context: InstallerContext):
 
     kvm_available = False
 
-    # Try kvm-ok command (Ubuntu)
-    if command_exists('kvm-ok'):
-        try:
-            result = run_command("kvm-ok", timeout=10)
-            if result.stdout and "KVM acceleration can be used" in result.stdout:
-                kvm_available = True
-        except subprocess.CalledProcessError:
-            pass
-
-    # Check /dev/kvm exists
-    if not kvm_available:
-        if Path("/dev/kvm").exists():
+    # /dev/kvm existing already proves KVM is loaded and usable, so the
+    # common path costs two syscalls and no subprocess
+    if os.path.exists("/dev/kvm"):
+        kvm_available = True
+        # Check if user has access (a single faccessat syscall; no
+        # need to fork a shell just to run `test`)
+        if not os.access("/dev/kvm", os.R_OK | os.W_OK):
+            log_warning(
+                "KVM device exists but may not be accessible. "
+                "You may need to add your user to the kvm group."
+            )
+    elif command_exists('kvm-ok'):
+        # Only worth the fork as a diagnostic: kvm-ok inspects CPUID and
+        # BIOS flags and can explain why the device is missing
+        # kvm-ok exits 0 when acceleration can be used; trusting the exit
+        # code avoids a locale-sensitive substring match on its output
+        result = run_command("kvm-ok", check=False, timeout=10)
+        if result.returncode == 0:
             kvm_available = True
-            # Check if user has access
-            try:
-                run_command("test -r /dev/kvm -a -w /dev/kvm", timeout=5)
-            except subprocess.CalledProcessError:
-                log_warning(
-                    "KVM device exists but may not be accessible. "
-                    "You may need to add your user to the kvm group."
-                )
+        elif result.stdout:
+            log_debug(f"kvm-ok diagnostic:\n{result.stdout.strip()}")
 
     if kvm_available:
         log_success("KVM virtualization support detected")
@@ -491,26 +773,6 @@ def check_kvm_support(context: InstallerContext):
         )
 
 
-def setup_libvirt_network_phase(context: InstallerContext):
-    """
-    DEPRECATED: This function is no longer used.
-
-    Network management has moved to infinization, which handles networking via nftables.
-    Libvirt is no longer installed or managed by the installer.
-
-    This function is retained temporarily for backwards compatibility and will be
-    removed in a future cleanup once all dependent phases are verified complete.
-
-    Args:
-        context: Installation configuration context
-    """
-    log_warning(
-        "setup_libvirt_network_phase() is deprecated. "
-        "Network management is now handled by infinization via nftables."
-    )
-    log_info("No libvirt network configuration performed - this is expected behavior.")
-
-
 def run_system_checks(context: InstallerContext):
     """
     Phase 2: Install system dependencies and verify installation.
@@ -532,50 +794,65 @@ def run_system_checks(context: InstallerContext):
     log_step(2, 5, "Installing system dependencies")
     log_info(f"Detected {context.os_info.pretty_name}")
 
+    # Read once; the invoking user does not change mid-install
+    sudo_user = os.environ.get('SUDO_USER')
+
     try:
+        # Build the noninteractive apt environment once for the whole phase
+        apt_env = {**os.environ, 'DEBIAN_FRONTEND': 'noninteractive', 'APT_LISTCHANGES_FRONTEND': 'none'}
+
         # Update package cache
-        update_package_cache(context)
+        update_package_cache(context, env=apt_env)
 
         # Install packages
-        install_packages(context)
-
-        # Verify installations
-        verify_installations(context)
-
-        # Initialize PostgreSQL (Fedora only)
-        initialize_postgresql(context)
-
-        # Enable and start services
-        enable_and_start_services(context)
-
-        # Install Rust toolchain via rustup
-        try:
-            install_rustup(context)
-        except RuntimeError as e:
-            log_error(f"Rust installation failed: {e}")
-            raise
-
-        # Verify mingw-w64 installation (for Windows builds)
-        try:
-            verify_mingw_installation(context)
-        except RuntimeError as e:
-            log_error(f"mingw-w64 verification failed: {e}")
-            raise
+        install_packages(context, env=apt_env)
+
+        # New binaries just landed in PATH; drop stale negative probes
+        command_exists.cache_clear()
+        get_command_version.cache_clear()
+
+        # Everything after the package install is mutually independent:
+        # command verification, the KVM probe, the PostgreSQL init→start
+        # chain, the rustup install, and the mingw check. Run them
+        # concurrently — install_rustup alone can spend minutes on the
+        # network, which hides the cost of all the shorter tasks. Failures
+        # are collected so every task reports its status before the first
+        # critical error is re-raised.
+        def postgres_chain():
+            initialize_postgresql(context)
+            enable_and_start_services(context, sudo_user=sudo_user)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                'Installation verification': executor.submit(verify_installations, context),
+                'KVM check': executor.submit(check_kvm_support, context),
+                'PostgreSQL setup': executor.submit(postgres_chain),
+                'Rust toolchain installation': executor.submit(install_rustup, context),
+                'mingw-w64 verification': executor.submit(verify_mingw_installation, context),
+            }
+
+            errors = []
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    if name == 'KVM check':
+                        # Non-critical: VMs can run unaccelerated
+                        log_warning(f"KVM check failed: {e}")
+                    else:
+                        log_error(f"{name} failed: {e}")
+                        errors.append(e)
+
+            if errors:
+                raise errors[0]
 
         # Network setup is handled by infinization via nftables
         # No libvirt network configuration needed
         log_info("Network management will be handled by infinization (nftables)")
 
-        # Check KVM support (non-critical)
-        try:
-            check_kvm_support(context)
-        except Exception as e:
-            log_warning(f"KVM check failed: {e}")
-
         log_success("System dependencies installed and configured successfully")
 
         # Helpful reminder
-        sudo_user = os.environ.get('SUDO_USER')
         if sudo_user:
             log_info(
                 "\nNote: If you were added to the kvm group, you may need to "
@@ -2,13 +2,20 @@
 Utility functions for command execution, password generation, and network detection.
 """
 
+import fcntl
+import functools
 import ipaddress
 import os
 import secrets
+import selectors
 import shlex
+import shutil
 import socket
 import string
+import struct
 import subprocess
+import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional, Union
 
@@ -31,7 +38,8 @@ def run_command(
     capture_output: bool = True,
     env: Optional[dict] = None,
     cwd: Optional[str] = None,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    stream: bool = False
 ) -> CommandResult:
     """
     Execute a shell command with consistent error handling.
@@ -43,6 +51,9 @@ def run_command(
         env: Custom environment variables
         cwd: Working directory
         timeout: Command timeout in seconds
+        stream: Forward output line-by-line as it is produced instead of
+            accumulating it all in memory; only a bounded tail is kept
+            for diagnostics (default: False)
 
     Returns:
         CommandResult object with execution details
@@ -62,6 +73,12 @@ def run_command(
     # Log the command
     log_command(command_str)
 
+    if stream:
+        return _run_command_streaming(
+            command_list, command_str,
+            check=check, env=env, cwd=cwd, timeout=timeout
+        )
+
     try:
         # Execute command
         result = subprocess.run(
@@ -101,31 +118,157 @@ def run_command(
         raise
 
 
+def _run_command_streaming(
+    command_list: list,
+    command_str: str,
+    check: bool,
+    env: Optional[dict],
+    cwd: Optional[str],
+    timeout: Optional[int]
+) -> CommandResult:
+    """
+    Run a command forwarding output line-by-line instead of accumulating it.
+
+    Long-running children (npm builds, ISO downloads) can print hundreds of
+    megabytes over their lifetime; buffering all of it just to log a failure
+    tail is pure memory bloat. Each line is forwarded to the debug log as it
+    arrives and only the last 200 lines are retained for error reporting.
+    stderr is merged into stdout to preserve ordering. The timeout is
+    enforced against the wall clock, not against output: a child that
+    goes silent with stdout still open is killed at the deadline.
+    """
+    start = time.monotonic()
+    process = subprocess.Popen(
+        command_list,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=env,
+        cwd=cwd
+    )
+
+    tail = deque(maxlen=200)
+
+    def _timed_out():
+        process.kill()
+        process.wait()
+        log_error(f"Command timed out after {timeout}s: {command_str}")
+        raise subprocess.TimeoutExpired(command_str, timeout)
+
+    try:
+        if timeout is None:
+            for line in process.stdout:
+                line = line.rstrip('\n')
+                tail.append(line)
+                log_debug(line)
+            returncode = process.wait()
+        else:
+            _stream_until_deadline(process, tail, start, timeout, _timed_out)
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                _timed_out()
+            returncode = process.wait(timeout=remaining)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        if process.stdout:
+            process.stdout.close()
+
+    output_tail = '\n'.join(tail)
+    cmd_result = CommandResult(
+        success=returncode == 0,
+        returncode=returncode,
+        stdout=output_tail,
+        stderr='',
+        command=command_str
+    )
+
+    if check and not cmd_result.success:
+        log_error(f"Command failed with exit code {returncode}: {command_str}")
+        if output_tail:
+            log_error(f"Last output:\n{output_tail}")
+        raise subprocess.CalledProcessError(
+            returncode=returncode,
+            cmd=command_str,
+            output=output_tail,
+            stderr=''
+        )
+
+    return cmd_result
+
+
+def _stream_until_deadline(process, tail, start, timeout, on_timeout):
+    """
+    Forward child stdout line-by-line until EOF, enforcing the deadline
+    even while the child is silent.
+
+    A blocking readline only notices the deadline when a line actually
+    arrives, so the pipe fd is polled with selectors instead: each wait
+    is capped at the time remaining, raw chunks are read and split into
+    lines by hand, and on_timeout (which kills the child and raises
+    TimeoutExpired) fires as soon as the deadline passes regardless of
+    whether the child ever writes again.
+    """
+    fd = process.stdout.fileno()
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+    pending = ''
+    try:
+        while True:
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                on_timeout()
+            if not sel.select(timeout=min(remaining, 1.0)):
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            pending += chunk.decode(errors='replace')
+            lines = pending.split('\n')
+            pending = lines.pop()
+            for line in lines:
+                tail.append(line)
+                log_debug(line)
+    finally:
+        sel.close()
+
+    if pending:
+        tail.append(pending)
+        log_debug(pending)
+
+
+@functools.lru_cache(maxsize=None)
 def command_exists(command: str) -> bool:
     """
     Check if a command is available in PATH.
 
+    Uses shutil.which (an in-process PATH walk) rather than forking a
+    `which` subprocess, and memoizes the result: the install phases probe
+    the same commands repeatedly (node, npm, rustup, ...). Call
+    command_exists.cache_clear() after installing packages or changing
+    PATH so newly available binaries are seen.
+
     Args:
         command: Command name to check
 
     Returns:
         True if command exists, False otherwise
     """
-    try:
-        result = run_command(
-            f"which {command}",
-            check=False,
-            capture_output=True
-        )
-        return result.success
-    except Exception:
-        return False
+    return shutil.which(command) is not None
 
 
+@functools.lru_cache(maxsize=None)
 def get_command_version(command: str, version_flag: str = "--version") -> Optional[str]:
     """
     Get version string from a command.
 
+    Memoized for the same reason as command_exists: the same binaries are
+    version-probed in several phases and each probe is a fork. Call
+    get_command_version.cache_clear() together with
+    command_exists.cache_clear() after installs or PATH changes.
+
     Args:
         command: Command to check
         version_flag: Flag to get version (default: --version)
@@ -133,11 +276,16 @@ def get_command_version(command: str, version_flag: str = "--version") -> Option
     Returns:
         Version string if successful, None otherwise
     """
+    # Fast path: no binary, no fork
+    if shutil.which(command) is None:
+        return None
+
     try:
         result = run_command(
             f"{command} {version_flag}",
             check=False,
-            capture_output=True
+            capture_output=True,
+            timeout=3
         )
         if result.success:
             # Return first line of output (usually contains version)
@@ -167,35 +315,100 @@ def generate_random_password(length: int = 32) -> str:
     # All characters
     all_chars = lowercase + uppercase + digits + special
 
+    rng = secrets.SystemRandom()
+
     # Ensure at least one of each type
     password = [
-        secrets.choice(lowercase),
-        secrets.choice(uppercase),
-        secrets.choice(digits),
-        secrets.choice(special),
+        rng.choice(lowercase),
+        rng.choice(uppercase),
+        rng.choice(digits),
+        rng.choice(special),
     ]
 
     # Fill remaining length with random characters
-    password.extend(secrets.choice(all_chars) for _ in range(length - 4))
+    password.extend(rng.choice(all_chars) for _ in range(length - 4))
 
     # Shuffle to avoid predictable pattern
-    password_list = list(password)
-    for i in range(len(password_list) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        password_list[i], password_list[j] = password_list[j], password_list[i]
+    rng.shuffle(password)
+
+    return ''.join(password)
 
-    return ''.join(password_list)
+
+def _interface_ipv4(sock, name: str) -> Optional[str]:
+    """
+    Return the IPv4 address of one interface via the SIOCGIFADDR ioctl.
+
+    One syscall, no subprocess, no packets sent. Returns None when the
+    interface has no IPv4 address.
+    """
+    SIOCGIFADDR = 0x8915
+    try:
+        packed = fcntl.ioctl(
+            sock.fileno(),
+            SIOCGIFADDR,
+            struct.pack('256s', name.encode()[:15])
+        )
+    except OSError:
+        return None
+    return socket.inet_ntoa(packed[20:24])
+
+
+def _iter_interface_ipv4():
+    """
+    Yield (interface, IPv4 address) pairs for all configured interfaces.
+
+    Interfaces without an IPv4 address are skipped.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for _index, name in socket.if_nameindex():
+            ip = _interface_ipv4(s, name)
+            if ip is not None:
+                yield name, ip
 
 
+@functools.lru_cache(maxsize=1)
 def detect_host_ip() -> str:
     """
     Auto-detect the primary network interface IP address.
 
+    Selection is by routing, not interface order: the default-route
+    interface is resolved first and its address read via SIOCGIFADDR, so
+    multi-homed hosts get the address peers actually reach. Enumerating
+    all interfaces (filtering loopback/docker/bridge names) and the
+    UDP-connect trick remain as fallbacks.
+
+    Memoized: the result cannot change during a single installer run but
+    several phases re-detect it. Call detect_host_ip.cache_clear() to
+    force a re-detection after a network change.
+
     Returns:
         Detected IP address, or fallback "192.168.1.100" if detection fails
     """
     try:
-        # Method 1: Connect to external IP (doesn't actually send data)
+        primary = detect_primary_interface()
+        if primary:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                ip = _interface_ipv4(s, primary)
+            if ip and not ip.startswith('127.'):
+                log_debug(f"Detected host IP on default-route interface {primary}: {ip}")
+                return ip
+    except OSError as e:
+        log_debug(f"Default-route interface lookup failed: {e}")
+
+    skip_prefixes = ('lo', 'docker', 'br-', 'virbr', 'veth')
+    try:
+        for name, ip in _iter_interface_ipv4():
+            if any(name.startswith(prefix) for prefix in skip_prefixes):
+                continue
+            if ip.startswith('127.') or ip.startswith('172.17.'):
+                continue
+            log_debug(f"Detected host IP on {name}: {ip}")
+            return ip
+    except OSError as e:
+        log_debug(f"Interface enumeration failed: {e}, trying socket method")
+
+    try:
+        # Last resort: Connect to external IP (doesn't actually send data)
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(('8.8.8.8', 80))
             ip = s.getsockname()[0]
@@ -212,26 +425,7 @@ def detect_host_ip() -> str:
             return ip
 
     except Exception as e:
-        log_debug(f"Socket method failed: {e}, trying ip command")
-
-    try:
-        # Method 2: Parse 'ip addr' output
-        result = run_command('ip addr show', check=False, capture_output=True)
-        if result.success:
-            for line in result.stdout.split('\n'):
-                if 'inet ' in line and 'scope global' in line:
-                    parts = line.strip().split()
-                    for i, part in enumerate(parts):
-                        if part == 'inet' and i + 1 < len(parts):
-                            ip_with_mask = parts[i + 1]
-                            ip = ip_with_mask.split('/')[0]
-
-                            # Exclude loopback and docker
-                            if not ip.startswith('127.') and not ip.startswith('172.17.'):
-                                log_debug(f"Detected host IP from ip command: {ip}")
-                                return ip
-    except Exception as e:
-        log_debug(f"ip command failed: {e}")
+        log_debug(f"Socket method failed: {e}")
 
     # Fallback
     fallback_ip = "192.168.1.100"
@@ -240,14 +434,32 @@ def detect_host_ip() -> str:
     return fallback_ip
 
 
+@functools.lru_cache(maxsize=1)
 def detect_primary_interface() -> Optional[str]:
     """
     Detect the primary network interface with internet connectivity.
 
+    Memoized like detect_host_ip; call
+    detect_primary_interface.cache_clear() to force a re-detection.
+
     Returns:
         Interface name (e.g., 'eth0', 'ens33') or None if detection fails
     """
-    # Try using ip route to find default interface
+    # Fast path: read the kernel routing table directly. The IPv4 default
+    # route is the /proc/net/route line whose destination is all zeros,
+    # with the interface name in the first column — no subprocess needed.
+    try:
+        with open('/proc/net/route') as f:
+            next(f, None)  # header line
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 2 and fields[1] == '00000000':
+                    log_debug(f"Detected primary interface from /proc/net/route: {fields[0]}")
+                    return fields[0]
+    except OSError as e:
+        log_debug(f"Could not read /proc/net/route: {e}")
+
+    # Fallback: parse `ip route` output
     result = run_command('ip route show default', check=False, capture_output=True)
     if result and result.returncode == 0:
         output = result.stdout.strip()
@@ -6,6 +6,8 @@ needed for Windows VM installations.
 """
 
 import os
+import re
+import time
 import urllib.request
 import urllib.error
 from typing import Optional, Tuple
@@ -21,6 +23,10 @@ VIRTIO_ISO_FILENAME = "virtio-win.iso"
 # Minimum expected ISO size (in bytes) - virtio-win is typically ~700MB+
 MIN_ISO_SIZE = 500 * 1024 * 1024  # 500 MB
 
+# Compiled once at import; used by update_env_with_virtio_path
+_VIRTIO_SET_RE = re.compile(r'^VIRTIO_WIN_ISO_PATH=.*$', re.M)
+_VIRTIO_COMMENTED_RE = re.compile(r'^# VIRTIO_WIN_ISO_PATH=.*$', re.M)
+
 
 def check_existing_virtio_iso(context: InstallerContext) -> Optional[str]:
     """
@@ -40,7 +46,12 @@ def check_existing_virtio_iso(context: InstallerContext) -> Optional[str]:
     ]
 
     for path in search_paths:
-        if os.path.exists(path) and os.path.getsize(path) > MIN_ISO_SIZE:
+        # One stat per candidate: existence and size come from the same call
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if st.st_size > MIN_ISO_SIZE:
             log_debug(f"Found existing VirtIO ISO at: {path}")
             return path
 
@@ -51,6 +62,11 @@ def download_with_progress(url: str, destination: str) -> bool:
     """
     Download file from URL to destination with progress reporting.
 
+    Streams in 1 MiB chunks instead of urlretrieve's 8 KiB blocks —
+    ~128x fewer write syscalls and Python-level iterations over a
+    ~750 MB ISO — and rate-limits the progress line to a few updates a
+    second so terminal I/O never dominates the transfer.
+
     Args:
         url: Source URL
         destination: Destination file path
@@ -59,20 +75,32 @@ def download_with_progress(url: str, destination: str) -> bool:
         True if download successful, False otherwise
     """
     try:
-        def report_progress(block_num, block_size, total_size):
-            """Report download progress."""
-            if total_size > 0:
-                downloaded = block_num * block_size
-                percent = min(100, (downloaded * 100) // total_size)
-                mb_downloaded = downloaded / (1024 * 1024)
-                mb_total = total_size / (1024 * 1024)
-
-                # Update progress on same line
-                print(f"\r  Progress: {percent}% ({mb_downloaded:.1f} MB / {mb_total:.1f} MB)",
-                      end='', flush=True)
-
         log_info(f"Downloading from: {url}")
-        urllib.request.urlretrieve(url, destination, reporthook=report_progress)
+
+        with urllib.request.urlopen(url) as response:
+            total_size = int(response.headers.get('Content-Length') or 0)
+            downloaded = 0
+            last_report = 0.0
+
+            with open(destination, 'wb') as f:
+                while True:
+                    chunk = response.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    downloaded += len(chunk)
+
+                    now = time.monotonic()
+                    if total_size > 0 and (now - last_report >= 0.25 or downloaded >= total_size):
+                        last_report = now
+                        percent = min(100, (downloaded * 100) // total_size)
+                        mb_downloaded = downloaded / (1024 * 1024)
+                        mb_total = total_size / (1024 * 1024)
+
+                        # Update progress on same line
+                        print(f"\r  Progress: {percent}% ({mb_downloaded:.1f} MB / {mb_total:.1f} MB)",
+                              end='', flush=True)
+
         print()  # New line after progress
 
         return True
@@ -208,24 +236,32 @@ def update_env_with_virtio_path(context: InstallerContext, iso_path: str):
             env_content = f.read()
 
         # Check if VIRTIO_WIN_ISO_PATH is already set (not commented)
-        if '\nVIRTIO_WIN_ISO_PATH=' in env_content:
+        if _VIRTIO_SET_RE.search(env_content):
             log_debug("VIRTIO_WIN_ISO_PATH already set in .env")
             return
 
         # Add or uncomment VIRTIO_WIN_ISO_PATH
-        if '# VIRTIO_WIN_ISO_PATH=' in env_content:
-            # Uncomment and set the path
-            env_content = env_content.replace(
-                '# VIRTIO_WIN_ISO_PATH=/path/to/virtio-win.iso',
-                f'VIRTIO_WIN_ISO_PATH={iso_path}'
-            )
-        else:
+        env_content, replaced = _VIRTIO_COMMENTED_RE.subn(
+            f'VIRTIO_WIN_ISO_PATH={iso_path}', env_content, count=1
+        )
+        if not replaced:
             # Add new entry
             env_content += f'\n# VirtIO Windows Drivers ISO (auto-configured)\nVIRTIO_WIN_ISO_PATH={iso_path}\n'
 
-        # Write updated .env
-        with open(env_path, 'w') as f:
-            f.write(env_content)
+        # Write updated .env atomically: a crash mid-write must not leave
+        # a truncated config, so write a sibling temp file and rename it
+        # over the original (os.replace is atomic on POSIX).
+        tmp_path = env_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(env_content)
+            os.replace(tmp_path, env_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
         log_debug(f"Updated .env with VIRTIO_WIN_ISO_PATH={iso_path}")
 
@@ -11,6 +11,8 @@ Safely removes Infinibay installation:
 
 import argparse
 import os
+import shlex
+import shutil
 import subprocess
 import sys
 
@@ -96,21 +98,33 @@ Examples:
 
 
 def run_command(command, dry_run=False, check=True):
-    """Execute a command with optional dry-run mode."""
+    """
+    Execute a command with optional dry-run mode.
+
+    Accepts an argv list or a plain string; strings are shlex-split and
+    run without an intermediate shell (mirroring lib.utils.run_command),
+    saving a /bin/sh fork per invocation.
+    """
+    if isinstance(command, str):
+        command_list = shlex.split(command)
+        command_str = command
+    else:
+        command_list = command
+        command_str = ' '.join(command)
+
     if dry_run:
-        logger.log_info(f"[DRY RUN] Would execute: {command}")
+        logger.log_info(f"[DRY RUN] Would execute: {command_str}")
         return True
 
-    logger.log_debug(f"$ {command}")
+    logger.log_debug(f"$ {command_str}")
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            command_list,
             capture_output=True,
             text=True
         )
         if check and result.returncode != 0:
-            logger.log_error(f"Command failed: {command}")
+            logger.log_error(f"Command failed: {command_str}")
             logger.log_error(f"Error: {result.stderr}")
             return False
         return True
@@ -119,27 +133,42 @@ def run_command(command, dry_run=False, check=True):
         return False
 
 
-def stop_and_disable_service(service_name, dry_run=False):
-    """Stop and disable a systemd service."""
-    logger.log_info(f"Stopping service: {service_name}...")
+def stop_and_disable_services(service_names, dry_run=False):
+    """
+    Stop and disable systemd services.
 
-    # Check if service exists
-    check_cmd = f"systemctl list-unit-files | grep -q {service_name}"
-    result = subprocess.run(check_cmd, shell=True, capture_output=True)
+    systemctl accepts multiple unit names per invocation, so the whole
+    teardown is one stop and one disable call instead of two per service.
+    """
+    # Check which services exist. systemctl cat exits non-zero for an
+    # unknown unit, so one process answers the question — no grep, no
+    # pipe buffers; output is discarded at the fd level via DEVNULL.
+    existing = []
+    for service_name in service_names:
+        result = subprocess.run(
+            ['systemctl', 'cat', f'{service_name}.service'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+        if result.returncode != 0:
+            logger.log_warning(f"Service {service_name} not found, skipping")
+        else:
+            existing.append(service_name)
 
-    if result.returncode != 0:
-        logger.log_warning(f"Service {service_name} not found, skipping")
+    if not existing:
         return True
 
-    # Stop service
-    if not run_command(f"systemctl stop {service_name}", dry_run, check=False):
-        logger.log_warning(f"Failed to stop {service_name} (may not be running)")
+    names = ' '.join(existing)
+    logger.log_info(f"Stopping services: {names}...")
 
-    # Disable service
-    if not run_command(f"systemctl disable {service_name}", dry_run, check=False):
-        logger.log_warning(f"Failed to disable {service_name} (may not be enabled)")
+    if not run_command(f"systemctl stop {names}", dry_run, check=False):
+        logger.log_warning("Failed to stop some services (may not be running)")
 
-    logger.log_success(f"Service {service_name} stopped and disabled")
+    if not run_command(f"systemctl disable {names}", dry_run, check=False):
+        logger.log_warning("Failed to disable some services (may not be enabled)")
+
+    logger.log_success(f"Services stopped and disabled: {names}")
     return True
 
 
@@ -184,7 +213,6 @@ def remove_installation_directory(install_dir, dry_run=False):
         logger.log_info(f"[DRY RUN] Would remove: {install_dir}")
     else:
         try:
-            import shutil
             shutil.rmtree(install_dir)
             logger.log_success(f"Removed: {install_dir}")
         except Exception as e:
@@ -198,21 +226,21 @@ def remove_database(db_name, db_user, dry_run=False):
     """Remove PostgreSQL database and user."""
     logger.log_info("Removing PostgreSQL database and user...")
 
-    # Drop database
-    logger.log_info(f"Dropping database: {db_name}...")
-    drop_db_cmd = f"sudo -u postgres psql -c \"DROP DATABASE IF EXISTS {db_name};\""
-    if not run_command(drop_db_cmd, dry_run, check=False):
-        logger.log_warning(f"Failed to drop database {db_name} (may not exist)")
-    else:
-        logger.log_success(f"Database {db_name} dropped")
-
-    # Drop user
-    logger.log_info(f"Dropping user: {db_user}...")
-    drop_user_cmd = f"sudo -u postgres psql -c \"DROP USER IF EXISTS {db_user};\""
-    if not run_command(drop_user_cmd, dry_run, check=False):
-        logger.log_warning(f"Failed to drop user {db_user} (may not exist)")
+    # Drop database and user in one psql session. Each statement gets its
+    # own -c so it runs in its own transaction: a multi-statement -c runs
+    # inside an implicit transaction block, where DROP DATABASE is
+    # rejected outright. IF EXISTS makes each statement a no-op when the
+    # object is already gone.
+    logger.log_info(f"Dropping database {db_name} and user {db_user}...")
+    drop_cmd = (
+        f"sudo -u postgres psql "
+        f"-c \"DROP DATABASE IF EXISTS {db_name};\" "
+        f"-c \"DROP USER IF EXISTS {db_user};\""
+    )
+    if not run_command(drop_cmd, dry_run, check=False):
+        logger.log_warning(f"Failed to drop database {db_name} / user {db_user} (may not exist)")
     else:
-        logger.log_success(f"User {db_user} dropped")
+        logger.log_success(f"Database {db_name} and user {db_user} dropped")
 
     return True
 
@@ -244,13 +272,11 @@ def remove_rustup(dry_run=False):
     try:
         # Remove .cargo directory
         if os.path.exists(cargo_dir):
-            import shutil
             shutil.rmtree(cargo_dir)
             logger.log_success(f"Removed: {cargo_dir}")
 
         # Remove .rustup directory
         if os.path.exists(rustup_dir):
-            import shutil
             shutil.rmtree(rustup_dir)
             logger.log_success(f"Removed: {rustup_dir}")
 
@@ -316,8 +342,7 @@ def main():
 
     # Stop and disable services
     services = ['infinibay-backend', 'infinibay-frontend']
-    for service in services:
-        stop_and_disable_service(service, args.dry_run)
+    stop_and_disable_services(services, args.dry_run)
 
     # Remove service files
     for service in services: